@@ -96,11 +96,31 @@ from __future__ import annotations
 import inspect
 import sys
 from enum import Enum
-from typing import Callable, Dict, List, TypeVar, Union, Type, Optional, Any
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 
 Primitive = Union[str, int, float, bool, None]
 JsonType = Union[dict, List, Primitive]
 
+# Bound at module load so parse dispatches on type(raw) with one dict lookup
+# instead of re-reading Union.__args__ and scanning isinstance tuples on every
+# node of the json tree.
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+_JSON_TYPES = (dict, list) + _PRIMITIVE_TYPES
+_PRIMITIVE_DISPATCH = dict.fromkeys(_PRIMITIVE_TYPES)
+
+
+# Sentinel for distinguishing an unassigned slot from a stored None.
+_UNSET = object()
+
 
 def _trivial_constructor(raw: JsonType) -> JsonType:
     """
@@ -114,11 +134,41 @@ def _trivial_constructor(raw: JsonType) -> JsonType:
 
 
 class ApiObject:
+    # Parsed fields live in __dict__, which the declared slot keeps; naming it
+    # explicitly drops the __weakref__ slot every instance would otherwise
+    # carry. The other two slots are the dirty-tracking bookkeeping that lets
+    # raw hand back the source dict for unmutated instances.
+    __slots__ = ("__dict__", "_raw_source", "_dirty")
+
     sub_resources: Dict[str, _ResourceConstructor] = {}
 
-    def __init__(self, *_, **kwargs):
-        if kwargs:
-            self.__dict__ = self.parse(kwargs).__dict__
+    # Lazily populated per class by _build_parse_plan; maps field name to
+    # subresource constructor so parse avoids a method call per field.
+    __parse_plan__ = None
+
+    # Set by the slotted decorator to the tuple of slot-backed field names;
+    # None means fields are stored in __dict__ as normal.
+    __slotted_fields__ = None
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Any post-construction write invalidates the cached source dict;
+        # parse sets its bookkeeping through object.__setattr__ directly so
+        # construction doesn't trip this.
+        object.__setattr__(self, "_dirty", True)
+
+    @classmethod
+    def _build_parse_plan(cls) -> Dict[str, _ResourceConstructor]:
+        """
+        Compiles the subresource constructors into a plain dict cached on the
+        class, so that parse can resolve constructors with a single dict
+        lookup rather than going through _get_subresource_constructor for
+        every field of every parsed dict.
+        :return:
+        """
+        plan = dict(cls.sub_resources)
+        cls.__parse_plan__ = plan
+        return plan
 
     @classmethod
     def _get_subresource_constructor(cls, key: str) -> _ResourceConstructor:
@@ -129,9 +179,11 @@ class ApiObject:
         :param key:
         :return:
         """
-        subresource_constructor = cls.sub_resources.get(key, _trivial_constructor)
+        ctor_map = cls.__dict__.get("__parse_plan__")
+        if ctor_map is None:
+            ctor_map = cls._build_parse_plan()
 
-        return subresource_constructor
+        return ctor_map.get(key, _trivial_constructor)
 
     @classmethod
     def parse(cls, raw: JsonType) -> Union[List[ApiObject], ApiObject, Primitive]:
@@ -141,58 +193,175 @@ class ApiObject:
         :param raw:
         :return:
         """
-        if not isinstance(raw, JsonType.__args__):
+        raw_type = type(raw)
+        if raw_type in _PRIMITIVE_DISPATCH:
+            return raw
+
+        if raw_type is list:
+            return cls.parse_collection(raw)
+
+        if raw_type is not dict:
             raise TypeError(
-                f"Api resources must be composed of the following types: {JsonType.__args__}, "
-                f"{type(raw)} was supplied."
+                f"Api resources must be composed of the following types: "
+                f"{_JSON_TYPES}, {raw_type} was supplied."
             )
 
-        if isinstance(raw, Primitive.__args__):
-            return raw
+        return cls._parse_dict_fast(raw)
 
-        if isinstance(raw, list):
-            return cls.parse_collection(raw)
+    @classmethod
+    def from_kwargs(cls: Type[RestResource], **kwargs) -> RestResource:
+        """
+        Keyword-argument construction, e.g. SubResource.from_kwargs(foo="bar").
 
-        if isinstance(raw, dict):
-            resource_content = []
+        parse is the constructor for ApiObject instances (it builds them via
+        object.__new__ and never runs __init__); this is just the ergonomic
+        spelling of parse for a literal resource.
+        :param kwargs: the raw resource as keyword arguments
+        :return:
+        """
+        return cls.parse(kwargs)
+
+    @classmethod
+    def _parse_dict_fast(cls, raw: dict) -> ApiObject:
+        """
+        The dict branch of parse, split out so callers that already know the
+        input is a dict (e.g. parse_collection on a homogeneous collection)
+        can skip the type dispatch entirely.
+        :param raw:
+        :return:
+        """
+        # The plan is looked up via cls.__dict__ so each class caches its
+        # own plan rather than inheriting a parent's.
+        ctor_map = cls.__dict__.get("__parse_plan__")
+        if ctor_map is None:
+            ctor_map = cls._build_parse_plan()
+        get_constructor = ctor_map.get
+        # json keys are always str, so interning is safe; a collection of N
+        # parsed instances then shares one string object per field name
+        # instead of holding N copies, and interned keys take the fast path
+        # in subsequent dict lookups.
+        intern = sys.intern
+
+        _set = object.__setattr__
+
+        fields = cls.__slotted_fields__
+        if fields is not None:
+            # Slot-backed classes can't take a wholesale __dict__ assignment
+            # (slot descriptors would shadow it), so fields are set one by
+            # one; declared fields land in slots, anything undeclared falls
+            # through to __dict__.
+            instance = object.__new__(cls)
             for key, value in raw.items():
-                parsed = cls._get_subresource_constructor(key)(value)
-                resource_content.append((key, parsed))
-            instance = cls()
-            instance.__dict__ = dict(resource_content)
+                setattr(
+                    instance,
+                    intern(key),
+                    get_constructor(key, _trivial_constructor)(value),
+                )
+            _set(instance, "_raw_source", raw)
+            _set(instance, "_dirty", False)
             return instance
 
+        # object.__new__ skips __init__, which has nothing to do here; the
+        # instance state is the assigned __dict__. The bookkeeping is set via
+        # object.__setattr__ so __setattr__ doesn't immediately mark the
+        # fresh instance dirty.
+        instance = object.__new__(cls)
+        _set(
+            instance,
+            "__dict__",
+            {
+                intern(key): get_constructor(key, _trivial_constructor)(value)
+                for key, value in raw.items()
+            },
+        )
+        _set(instance, "_raw_source", raw)
+        _set(instance, "_dirty", False)
+        return instance
+
     @classmethod
     def parse_collection(
             cls, collection: List[JsonType]
     ) -> List[Union[ApiObject, Primitive]]:
         """
         Convenience function for cases where a resource has a property which is a collection of
-        sub-resources with a set schema.
+        sub-resources with a set schema. Dict elements are parsed in a tight
+        loop over the dict branch without re-entering parse, and nested lists
+        are walked with an explicit work stack - the same transformation as
+        _collection_to_raw - so list nesting, which is payload-driven (unlike
+        dict nesting, whose depth is bounded by the declared schema), is not
+        capped by the interpreter recursion limit.
         :param collection:
         :return:
         """
-        return [cls.parse(item) for item in collection]
+        parse_dict = cls._parse_dict_fast
+        out: list = [None] * len(collection)
+        stack = [(collection, out)]
+        while stack:
+            source, target = stack.pop()
+            for index, item in enumerate(source):
+                item_type = type(item)
+                if item_type is dict:
+                    target[index] = parse_dict(item)
+                elif item_type is list:
+                    child: list = [None] * len(item)
+                    target[index] = child
+                    stack.append((item, child))
+                elif item_type in _PRIMITIVE_DISPATCH:
+                    target[index] = item
+                else:
+                    raise TypeError(
+                        f"Api resources must be composed of the following types: "
+                        f"{_JSON_TYPES}, {item_type} was supplied."
+                    )
+
+        return out
+
+    def _slot_items(self):
+        """
+        The (key, value) pairs of a slot-backed instance: the declared fields
+        that have been assigned, followed by anything undeclared that ended
+        up in __dict__.
+        :return:
+        """
+        items = [
+            (name, value)
+            for name in self.__slotted_fields__
+            if (value := getattr(self, name, _UNSET)) is not _UNSET
+        ]
+        items.extend(self.__dict__.items())
+        return items
 
     @staticmethod
     def _collection_to_raw(
             collection: List[Union[JsonType, ApiObject]]
     ) -> List[JsonType]:
         """
-        Handles recursively casting lists of items to their respective JsonType
+        Handles recursively casting lists of items to their respective JsonType.
+
+        Nested lists are walked with an explicit work stack rather than by
+        recursing, so there's no Python frame per nesting level and the
+        nesting depth isn't bounded by the interpreter recursion limit.
         :param collection:
         :return:
         """
-        raw_collection: list = [None for _ in collection]
-        for index, item in enumerate(collection):
-            if isinstance(item, ApiObject):
-                raw_collection[index] = item.raw
-            elif isinstance(item, list):
-                raw_collection[index] = ApiObject._collection_to_raw(item)
-            else:
-                raw_collection[index] = item
-
-        return raw_collection
+        out: list = [None] * len(collection)
+        stack = [(collection, out)]
+        while stack:
+            source, target = stack.pop()
+            for index, item in enumerate(source):
+                # type identity first: it's a single pointer compare, and
+                # isinstance's MRO walk is reserved for ApiObject, the one
+                # case where subclass polymorphism actually matters.
+                if type(item) is list:
+                    child: list = [None] * len(item)
+                    target[index] = child
+                    stack.append((item, child))
+                elif isinstance(item, ApiObject):
+                    target[index] = item.raw
+                else:
+                    target[index] = item
+
+        return out
 
     @property
     def raw(self) -> dict:
@@ -203,14 +372,32 @@ class ApiObject:
 
         Recursively converts all of its properties to their original
         json type.
+
+        For instances that came out of parse and haven't been written to
+        since, the source dict is returned directly instead of being rebuilt.
+        Note the dirty tracking is shallow: reassigning a field marks this
+        instance dirty, but mutating a nested sub-resource or list in place
+        does not mark its parents.
         :return:
         """
+        if not getattr(self, "_dirty", True):
+            return self._raw_source
+
         raw = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, ApiObject):
-                raw[key] = value.raw
-            elif isinstance(value, list):
-                raw[key] = self._collection_to_raw(value)
+        if self.__slotted_fields__ is None:
+            items = self.__dict__.items()
+        else:
+            items = self._slot_items()
+        for key, value in items:
+            # Most fields are primitives, for which the getattr probe fails
+            # in one lookup; isinstance's MRO walk only runs for values that
+            # actually expose a raw attribute. type is list is a pointer
+            # compare rather than another MRO walk.
+            value_raw = getattr(value, "raw", None)
+            if value_raw is not None and isinstance(value, ApiObject):
+                raw[key] = value_raw
+            elif type(value) is list:
+                raw[key] = ApiObject._collection_to_raw(value)
             elif isinstance(value, Enum):
                 raw[key] = value.value
             else:
@@ -219,6 +406,79 @@ class ApiObject:
         return raw
 
 
+class LazyApiObject(ApiObject):
+    """
+    An ApiObject that defers parsing until fields are actually read. parse
+    just keeps hold of the source dict; each field is run through its
+    subresource constructor on first attribute access and cached, so
+    subsequent reads are a plain attribute lookup.
+
+    For large responses where the caller only touches a handful of fields,
+    this skips building the object graph for everything else.
+    """
+
+    __slots__ = ("_raw",)
+
+    @classmethod
+    def parse(cls, raw: JsonType) -> Union[List[ApiObject], ApiObject, Primitive]:
+        """
+        As ApiObject.parse, except dicts are stored as-is rather than walked;
+        see the class docstring.
+        :param raw:
+        :return:
+        """
+        if type(raw) is not dict:
+            return super().parse(raw)
+
+        return cls._parse_dict_fast(raw)
+
+    @classmethod
+    def _parse_dict_fast(cls, raw: dict) -> LazyApiObject:
+        """
+        Builds the lazy wrapper. Overridden so every dict path routes through
+        it - in particular parse_collection's fast path, which would
+        otherwise eagerly parse collections of lazy resources with the
+        inherited implementation.
+        :param raw:
+        :return:
+        """
+        instance = object.__new__(cls)
+        instance._raw = raw
+        return instance
+
+    def __getattr__(self, name: str):
+        if name == "_raw":
+            # parse hasn't assigned the source dict yet; bail out before the
+            # self._raw lookup below recurses.
+            raise AttributeError(name)
+
+        try:
+            value = self._raw[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+        parsed = self._get_subresource_constructor(name)(value)
+        # Cached directly in __dict__ so the next access never reaches
+        # __getattr__.
+        self.__dict__[name] = parsed
+        return parsed
+
+    @property
+    def raw(self) -> dict:
+        """
+        The source dict, returned as-is while nothing has been materialised;
+        once fields have been materialised their converted values are
+        overlaid onto a copy of it.
+        :return:
+        """
+        if not self.__dict__:
+            return self._raw
+
+        merged = dict(self._raw)
+        merged.update(ApiObject.raw.fget(self))
+        return merged
+
+
 _ResourceConstructor = Callable[
     [JsonType], Union[List[ApiObject], ApiObject, JsonType]
 ]
@@ -226,10 +486,60 @@ RestResource = TypeVar("RestResource", bound=ApiObject)
 ErrorSchema = TypeVar("ErrorSchema", bound=ApiObject)
 
 
-def from_annotations(cls: Type[RestResource]) -> Type[RestResource]:
+def _compile_parse(cls: Type[RestResource]) -> classmethod:
+    """
+    Generates a parse function specialised to the class's compiled parse
+    plan. The schema is fixed once from_annotations has run, so instead of
+    resolving a constructor per field at parse time, the generated function
+    rebuilds the field dict with interned keys (as _parse_dict_fast does)
+    and fixes up only the declared sub-resource fields with constructor
+    calls inlined into the source; undeclared fields come along for free.
+
+    The generated function is a classmethod: non-dict input, and any
+    subclass that inherits it without being decorated itself, are handed
+    back to the generic ApiObject.parse, so subclasses construct instances
+    of themselves just as they did with the classmethod this shadows.
+    :param cls: The ApiObject subclass
+    :return:
     """
-    WARNING: this is an experimental feature, and is not covered by tests.
+    plan = cls.__dict__.get("__parse_plan__") or cls._build_parse_plan()
+
+    namespace = {
+        "_new": object.__new__,
+        "_set": object.__setattr__,
+        "_intern": sys.intern,
+        "_cls": cls,
+        "_generic_parse": ApiObject.parse.__func__,
+    }
+    lines = [
+        "def parse(cls, raw):",
+        "    if cls is not _cls or type(raw) is not dict:",
+        "        return _generic_parse(cls, raw)",
+        "    instance = _new(cls)",
+        "    fields = {_intern(key): value for key, value in raw.items()}",
+    ]
+    for index, name in enumerate(plan):
+        constructor_name = f"_ctor_{index}"
+        namespace[constructor_name] = plan[name]
+        lines.append(f"    if {name!r} in fields:")
+        lines.append(f"        fields[{name!r}] = {constructor_name}(fields[{name!r}])")
+    # Bookkeeping assigned via object.__setattr__, mirroring _parse_dict_fast.
+    lines.append("    _set(instance, '__dict__', fields)")
+    lines.append("    _set(instance, '_raw_source', raw)")
+    lines.append("    _set(instance, '_dirty', False)")
+    lines.append("    return instance")
+
+    exec("\n".join(lines), namespace)
+    compiled = namespace["parse"]
+    # Tagged so slotted can tell a generated parse (bound to the pre-rebuild
+    # class) from a hand-written override when it copies the namespace.
+    compiled._compiled_for = cls
+
+    return classmethod(compiled)
+
 
+def from_annotations(cls: Type[RestResource]) -> Type[RestResource]:
+    """
     Allows the subresource parsers to be inferred from the annotations
     on the class. This means you can define your object graph as follows.
 
@@ -280,41 +590,93 @@ def from_annotations(cls: Type[RestResource]) -> Type[RestResource]:
                 "from_annotations is not compatible with __future__.annotations for python versions less than 3.10"
             )
 
+    if "sub_resources" not in cls.__dict__:
+        # Give the class its own constructor mapping, otherwise the
+        # assignments below would mutate the dict shared with the parent
+        # (and for undecorated classes, ApiObject itself).
+        cls.sub_resources = dict(cls.sub_resources)
+
     for name, field_type in annotations_.items():
-        is_from_typing = isinstance(field_type, type(List[Any]))
-
-        if field_type in Primitive.__args__:
-            # If the annotation is a primitive then the constructor is
-            # just the default trivial constructor.
-            pass
-
-        elif (
-                is_from_typing
-                and field_type.__args__[0] in Primitive.__args__
-        ):
-            # If the annotation is a List[str] or some other primitive
-            # then the constructor is just the trivial constructor.
-            pass
-
-        elif (
-                is_from_typing
-                and issubclass(field_type.__args__[0], ApiObject)
-        ):
-            # If the annotation is a typing.List[ApiResource]
-            # we want to pull out the specific subclass that
-            # was annotated and set the subresource constructor
-            # to be its parse function.
-            cls.sub_resources[name] = field_type.__args__[0].parse
-
-        elif isinstance(field_type, type(Optional[Any])):
-            # Since sub-resources aren't going to be type hinted as Optional,
-            # we can assume that the passed type is primitive
-            cls.sub_resources[name] = field_type.__args__[0]
-
-        elif isinstance(field_type(), ApiObject):
-            # If the annotation is an instance of ApiObject we
-            # want to set the subresource constructor to its parse
-            # function
+        origin = get_origin(field_type)
+
+        if origin is list:
+            # For List[SubResource] we want the element type's parse as the
+            # constructor; lists of primitives keep the trivial constructor.
+            element_type = get_args(field_type)[0]
+            if inspect.isclass(element_type) and issubclass(element_type, ApiObject):
+                cls.sub_resources[name] = element_type.parse
+
+        elif origin is Union:
+            # Optional[SubResource] unwraps to the subresource's parse; any
+            # other union (e.g. Optional[str]) is assumed primitive and keeps
+            # the trivial constructor.
+            args = [arg for arg in get_args(field_type) if arg is not type(None)]
+            if (
+                    len(args) == 1
+                    and inspect.isclass(args[0])
+                    and issubclass(args[0], ApiObject)
+            ):
+                cls.sub_resources[name] = args[0].parse
+
+        elif inspect.isclass(field_type) and issubclass(field_type, ApiObject):
+            # A directly annotated sub-resource; issubclass on the class
+            # itself, so field types are never instantiated just to be
+            # classified.
             cls.sub_resources[name] = field_type.parse
 
+    # The schema is fully known at class-definition time, so compile the
+    # parse plan eagerly rather than waiting for the first parse, and attach
+    # a parse specialised to it. Slot-backed classes keep the generic parse,
+    # since the generated code assigns __dict__ wholesale.
+    cls._build_parse_plan()
+    if cls.__slotted_fields__ is None:
+        cls.parse = _compile_parse(cls)
+
     return cls
+
+
+def slotted(cls: Type[RestResource]) -> Type[RestResource]:
+    """
+    Rebuilds an ApiObject subclass so that its annotated fields are stored in
+    __slots__ instead of per-instance __dict__ entries. For responses with
+    many sub-resources this shrinks the memory footprint considerably and
+    speeds up attribute reads, since slots are fixed offsets rather than dict
+    lookups.
+
+    Undeclared fields still work: they fall through to __dict__ as usual,
+    it's only the declared schema that gets slot storage. Note that
+    class-level defaults can't coexist with a slot of the same name, so
+    annotated fields on a slotted class must not be assigned defaults.
+
+    Since __slots__ only takes effect at class creation, the class is rebuilt
+    rather than mutated; apply slotted as the outermost decorator.
+
+    :param cls: The ApiObject subclass
+    :return:
+    """
+    fields = tuple(cls.__dict__.get("__annotations__", ()))
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if key not in ("__dict__", "__weakref__")
+        and key not in fields
+        and not _is_compiled_parse(value)
+    }
+    namespace["__slots__"] = fields
+    namespace["__slotted_fields__"] = fields
+
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _is_compiled_parse(value) -> bool:
+    """
+    True for a parse generated by _compile_parse. Those are bound to the
+    class they were compiled for, so slotted must not carry one over to the
+    class it rebuilds (which falls back to the generic parse instead).
+    :param value:
+    :return:
+    """
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+
+    return getattr(value, "_compiled_for", None) is not None
@@ -0,0 +1,73 @@
+"""
+Helpers for eyeballing resources while developing a client. These are debug
+tools, so the only thing that matters is that they're readable and don't get
+in the way; orjson is used for the dumping when it's importable since its C
+encoder is several times faster than the stdlib's indented output on large
+payloads, but it's strictly optional.
+"""
+
+import json
+
+# Sentinel for distinguishing an unassigned slot from a stored None.
+_UNSET = object()
+
+# default=repr so values that aren't json-serialisable (parsed ApiObject
+# sub-resources, most obviously) still print something useful instead of the
+# dump raising mid-debug.
+try:
+    import orjson
+
+    def _dumps(d) -> str:
+        return orjson.dumps(d, option=orjson.OPT_INDENT_2, default=repr).decode()
+
+except ImportError:
+
+    def _dumps(d) -> str:
+        return json.dumps(d, indent=4, default=repr)
+
+
+def j_print(d) -> None:
+    """
+    Pretty-prints a json-serialisable dict.
+    :param d:
+    :return:
+    """
+    print(_dumps(d))
+
+
+def o_print(o) -> None:
+    """
+    Pretty-prints an object's attributes. Slot-backed fields are collected
+    from __slots__ across the MRO and merged with __dict__ (read via vars,
+    the C-level getter) - a class can have both, which is exactly what
+    resourceez's slotted resources do. Underscored slots are treated as
+    internal bookkeeping and skipped.
+    :param o:
+    :return:
+    """
+    d = {}
+    for klass in reversed(type(o).__mro__):
+        for slot in getattr(klass, "__slots__", ()):
+            if slot.startswith("_"):
+                continue
+            value = getattr(o, slot, _UNSET)
+            if value is not _UNSET:
+                d[slot] = value
+
+    try:
+        d.update(vars(o))
+    except TypeError:
+        pass
+
+    j_print(d)
+
+
+def l_print(l) -> None:
+    """
+    Pretty-prints a list via the repr of its elements. map dispatches repr
+    from C without a Python frame per element, which matters when dumping
+    large lists.
+    :param l:
+    :return:
+    """
+    j_print(list(map(repr, l)))
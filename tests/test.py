@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import sys
+
 from typing import List, Optional
 
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
-from resourceez.api_object import ApiObject, Primitive
+from resourceez.api_object import (
+    ApiObject,
+    LazyApiObject,
+    Primitive,
+    from_annotations,
+    slotted,
+)
 
 
 class FlatResource(ApiObject):
@@ -47,6 +55,14 @@ class NestedResourceCollection(ApiObject):
         return {"nested_collection": FlatResource.create_collection()}
 
 
+class NoDefaultConstructor(ApiObject):
+    foo: str
+
+    def __init__(self, required_argument):
+        super().__init__()
+        self.required_argument = required_argument
+
+
 class TestApiObject(TestCase):
     def test_parsed_resource_fields_are_available_via_object_access(self):
         for raw_resource in FlatResource.create_collection():
@@ -77,8 +93,198 @@ class TestApiObject(TestCase):
         distinct_types = {type(element) for element in parsed.nested_collection}
         self.assertSetEqual({FlatResource}, distinct_types)
 
+    def test_mixed_collections_parse_each_element_by_type(self):
+        raw = [FlatResource.create("foo"), 2, "three", None]
+
+        parsed = FlatResource.parse(raw)
+
+        self.assertIsInstance(parsed[0], FlatResource)
+        self.assertEqual("foo", parsed[0].primitive_property)
+        self.assertListEqual([2, "three", None], parsed[1:])
+
+    def test_collections_nested_beyond_the_recursion_limit_parse_and_serialise(self):
+        depth = sys.getrecursionlimit() * 2
+        nested: list = [FlatResource.create("foo")]
+        for _ in range(depth):
+            nested = [nested]
+
+        parsed = FlatResource.parse(nested)
+
+        innermost = parsed
+        for _ in range(depth):
+            innermost = innermost[0]
+        self.assertIsInstance(innermost[0], FlatResource)
+
+        raw = FlatResource._collection_to_raw(parsed)
+        for _ in range(depth):
+            raw = raw[0]
+        self.assertDictEqual(FlatResource.create("foo"), raw[0])
+
     def test_raw_returns_json_serializable_dict_equivalent_to_parsed_input(self):
         raw = NestedResourceCollection.create()
         parsed = NestedResourceCollection.parse(raw)
 
         self.assertDictEqual(raw, parsed.raw)
+
+    def test_raw_returns_the_source_dict_until_the_resource_is_mutated(self):
+        raw = NestedResource.create()
+        parsed = NestedResource.parse(raw)
+
+        self.assertIs(raw, parsed.raw)
+
+        parsed.nested = FlatResource.parse(FlatResource.create("changed"))
+
+        rebuilt = parsed.raw
+        self.assertIsNot(raw, rebuilt)
+        self.assertEqual("changed", rebuilt["nested"]["primitive_property"])
+
+    def test_from_kwargs_constructs_like_parse(self):
+        constructed = NestedResource.from_kwargs(nested=FlatResource.create("foo"))
+
+        self.assertIsInstance(constructed.nested, FlatResource)
+        self.assertEqual("foo", constructed.nested.primitive_property)
+
+
+@skipIf(
+    sys.version_info < (3, 10),
+    "from_annotations needs inspect.get_annotations to resolve string annotations",
+)
+class TestFromAnnotations(TestCase):
+    def test_subresource_constructors_are_inferred_from_annotations(self):
+        @from_annotations
+        class Resource(ApiObject):
+            field: int
+            nested: FlatResource
+            nested_collection: List[FlatResource]
+
+        parsed = Resource.parse(
+            {
+                "field": 1,
+                "nested": FlatResource.create("foo"),
+                "nested_collection": FlatResource.create_collection(),
+            }
+        )
+
+        self.assertEqual(1, parsed.field)
+        self.assertIsInstance(parsed.nested, FlatResource)
+        distinct_types = {type(element) for element in parsed.nested_collection}
+        self.assertSetEqual({FlatResource}, distinct_types)
+
+    def test_optional_subresource_annotation_is_unwrapped(self):
+        @from_annotations
+        class Resource(ApiObject):
+            nested: Optional[FlatResource]
+
+        parsed = Resource.parse({"nested": FlatResource.create("foo")})
+
+        self.assertIsInstance(parsed.nested, FlatResource)
+
+    def test_undecorated_subclasses_parse_as_themselves(self):
+        @from_annotations
+        class Resource(ApiObject):
+            nested: FlatResource
+
+        class Child(Resource):
+            pass
+
+        parsed = Child.parse({"nested": FlatResource.create("foo")})
+
+        self.assertIsInstance(parsed, Child)
+        self.assertIsInstance(parsed.nested, FlatResource)
+
+    def test_field_types_are_not_instantiated_during_classification(self):
+        @from_annotations
+        class Resource(ApiObject):
+            nested: NoDefaultConstructor
+
+        parsed = Resource.parse({"nested": {"foo": "bar"}})
+
+        self.assertIsInstance(parsed.nested, NoDefaultConstructor)
+        self.assertEqual("bar", parsed.nested.foo)
+
+
+class TestSlotted(TestCase):
+    def test_slotted_resource_stores_declared_fields_in_slots(self):
+        @slotted
+        class Resource(ApiObject):
+            primitive_property: Primitive
+            nullable_property: Optional[Primitive]
+
+        raw = FlatResource.create("foo")
+        parsed = Resource.parse(raw)
+
+        self.assertEqual("foo", parsed.primitive_property)
+        self.assertNotIn("primitive_property", parsed.__dict__)
+        self.assertDictEqual(raw, parsed.raw)
+
+    def test_slotted_resource_still_tolerates_undeclared_fields(self):
+        @slotted
+        class Resource(ApiObject):
+            primitive_property: Primitive
+
+        raw = {"primitive_property": 1, "undeclared": "value"}
+        parsed = Resource.parse(raw)
+
+        self.assertEqual("value", parsed.undeclared)
+        self.assertDictEqual(raw, parsed.raw)
+
+
+def _counting_flat_resource_constructor(raw):
+    LazyNestedResource.constructor_calls.append(raw)
+    return FlatResource.parse(raw)
+
+
+class LazyNestedResource(LazyApiObject):
+    constructor_calls = []
+
+    sub_resources = {
+        "nested": _counting_flat_resource_constructor,
+    }
+
+    nested: FlatResource
+
+    @classmethod
+    def create(cls, primitive="foo") -> dict:
+        return {"nested": FlatResource.create(primitive)}
+
+
+class TestLazyApiObject(TestCase):
+    def setUp(self):
+        LazyNestedResource.constructor_calls.clear()
+
+    def test_subresources_are_materialised_on_first_access_only(self):
+        parsed = LazyNestedResource.parse(LazyNestedResource.create())
+
+        self.assertEqual([], LazyNestedResource.constructor_calls)
+
+        first_access = parsed.nested
+        second_access = parsed.nested
+
+        self.assertIsInstance(first_access, FlatResource)
+        self.assertIs(first_access, second_access)
+        self.assertEqual(1, len(LazyNestedResource.constructor_calls))
+
+    def test_raw_returns_source_dict_while_nothing_is_materialised(self):
+        raw = LazyNestedResource.create()
+        parsed = LazyNestedResource.parse(raw)
+
+        self.assertIs(raw, parsed.raw)
+
+    def test_raw_reflects_materialised_fields(self):
+        raw = LazyNestedResource.create()
+        parsed = LazyNestedResource.parse(raw)
+        parsed.nested  # materialise
+
+        self.assertDictEqual(raw, parsed.raw)
+
+    def test_collections_of_lazy_resources_stay_lazy(self):
+        raw_collection = [
+            LazyNestedResource.create(primitive) for primitive in ("foo", "bar")
+        ]
+
+        parsed = LazyNestedResource.parse_collection(raw_collection)
+
+        self.assertEqual([], LazyNestedResource.constructor_calls)
+        self.assertIs(raw_collection[0], parsed[0].raw)
+        self.assertIsInstance(parsed[1].nested, FlatResource)
+        self.assertEqual(1, len(LazyNestedResource.constructor_calls))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from unittest import TestCase, skipIf
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+if requests is not None:
+    from resourceez.client import AuthHeader, ResourceClient, Verb
+
+requires_requests = skipIf(requests is None, "requests is not installed")
+
+
+@requires_requests
+class TestAuthHeader(TestCase):
+    def test_bearer_formats_the_authorization_header(self):
+        header = AuthHeader.bearer("token")
+
+        self.assertEqual({"Authorization": "Bearer token"}, dict(header))
+
+    def test_basic_base64_encodes_the_credentials(self):
+        header = AuthHeader.basic("user", "pass")
+
+        self.assertEqual({"Authorization": "Basic dXNlcjpwYXNz"}, dict(header))
+
+    def test_headers_are_cached_per_credential(self):
+        self.assertIs(AuthHeader.bearer("token"), AuthHeader.bearer("token"))
+        self.assertIsNot(AuthHeader.bearer("token"), AuthHeader.bearer("other"))
+
+    def test_cached_headers_are_immutable(self):
+        header = AuthHeader.bearer("token")
+
+        with self.assertRaises(TypeError):
+            header["Authorization"] = "tampered"
+
+
+@requires_requests
+class TestVerb(TestCase):
+    def test_members_are_their_method_strings(self):
+        for verb in Verb:
+            with self.subTest(verb=verb.name):
+                self.assertIsInstance(verb, str)
+                self.assertEqual(verb.name, verb)
+
+    def test_delete_is_not_aliased(self):
+        self.assertEqual("DELETE", Verb.DELETE)
+        self.assertNotEqual(Verb.GET, Verb.DELETE)
+
+
+@requires_requests
+class TestResourceClient(TestCase):
+    def _recording_client(self, base_url):
+        client = ResourceClient(base_url)
+        calls = []
+        client._session.request = lambda method, url, **kwargs: calls.append(
+            (method, url)
+        )
+        return client, calls
+
+    def test_base_url_and_path_are_joined_with_a_single_slash(self):
+        client, calls = self._recording_client("https://api.example.com/")
+
+        client.get("/things/1")
+        client.get("things/2")
+
+        self.assertEqual(
+            [
+                ("GET", "https://api.example.com/things/1"),
+                ("GET", "https://api.example.com/things/2"),
+            ],
+            calls,
+        )
+
+    def test_verb_helpers_use_their_verbs(self):
+        client, calls = self._recording_client("https://api.example.com")
+
+        client.post("a")
+        client.put("a")
+        client.patch("a")
+        client.delete("a")
+
+        self.assertListEqual(
+            ["POST", "PUT", "PATCH", "DELETE"], [method for method, _ in calls]
+        )
+
+    def test_pooled_adapter_is_mounted_on_both_schemes(self):
+        client = ResourceClient(
+            "https://api.example.com", pool_connections=3, pool_maxsize=7, retries=2
+        )
+
+        http_adapter = client._session.get_adapter("http://api.example.com")
+        https_adapter = client._session.get_adapter("https://api.example.com")
+
+        self.assertIs(http_adapter, https_adapter)
+        self.assertEqual(3, https_adapter._pool_connections)
+        self.assertEqual(7, https_adapter._pool_maxsize)
+        self.assertEqual(2, https_adapter.max_retries.total)
+
+    def test_headers_are_applied_to_the_session(self):
+        client = ResourceClient(
+            "https://api.example.com", headers=AuthHeader.bearer("token")
+        )
+
+        self.assertEqual(
+            "Bearer token", client._session.headers.get("Authorization")
+        )
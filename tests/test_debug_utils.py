@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import io
+
+from contextlib import redirect_stdout
+
+from unittest import TestCase
+
+from resourceez.api_object import ApiObject, Primitive, slotted
+from resourceez.util.debug_utils import o_print
+
+
+def _capture_o_print(o) -> str:
+    out = io.StringIO()
+    with redirect_stdout(out):
+        o_print(o)
+    return out.getvalue()
+
+
+class TestOPrint(TestCase):
+    def test_prints_dict_backed_attributes(self):
+        class Plain:
+            def __init__(self):
+                self.field = 1
+
+        printed = _capture_o_print(Plain())
+
+        self.assertIn('"field": 1', printed)
+
+    def test_prints_slot_backed_fields_of_slotted_resources(self):
+        @slotted
+        class Resource(ApiObject):
+            primitive_property: Primitive
+
+        parsed = Resource.parse({"primitive_property": 1, "undeclared": 2})
+        printed = _capture_o_print(parsed)
+
+        self.assertIn('"primitive_property": 1', printed)
+        self.assertIn('"undeclared": 2', printed)
+
+    def test_prints_resources_containing_subresources(self):
+        class Sub(ApiObject):
+            foo: str
+
+        class Resource(ApiObject):
+            sub_resources = {"sub": Sub.parse}
+
+            sub: Sub
+
+        parsed = Resource.parse({"sub": {"foo": "bar"}, "field": 1})
+        printed = _capture_o_print(parsed)
+
+        self.assertIn('"sub"', printed)
+        self.assertIn('"field": 1', printed)
+
+    def test_prints_pure_slots_objects(self):
+        class Slotted:
+            __slots__ = ("field",)
+
+            def __init__(self):
+                self.field = 3
+
+        printed = _capture_o_print(Slotted())
+
+        self.assertIn('"field": 3', printed)